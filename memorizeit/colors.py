@@ -2,9 +2,9 @@
 
 This module defines colors used in application. They are represented as (0-1,
 0-1, 0-1) or (0-255, 0-255, 0-255) (r, g, b) values. Module allows for
-conversion from 0-1 color code to 0-255. 0-1 representation is used with 3D
-figures created via `OpenGL`. 0-255 is used by `pygame`. It uses `random`
-module.
+conversion from 0-1 color code to 0-255 (palette colors are converted once at
+import). 0-1 representation is used with 3D figures created via `OpenGL`.
+0-255 is used by `pygame`. It uses `random` module.
 
 License:
 THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
@@ -16,7 +16,8 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from random import choice, sample
+import random
+from random import sample
 
 COLORS = {
     'Green': (0, 1, 0),
@@ -28,6 +29,18 @@ COLORS = {
     'Grey': (0.5, 0.5, 0.5)
 }
 
+GENERATOR = random.Random()
+
+OTHERS = {name: tuple(x for x in COLORS if x != name) for name in COLORS}
+
+VALUES = list(COLORS.values())
+
+COLORS_255 = {
+    name: tuple(int(x * 255) for x in rgb) for name, rgb in COLORS.items()
+}
+
+CONVERTED = {COLORS[name]: rgb for name, rgb in COLORS_255.items()}
+
 
 def pick(setting, amount):
     """Return colors values based on game setting.
@@ -53,9 +66,8 @@ def pick(setting, amount):
         random color.
     """
     if setting == 'Easy':
-        colors = sample(COLORS.keys(), amount)
-        return [COLORS[x] for x in colors]
-    return True if setting == 'Medium' else False
+        return sample(VALUES, amount)
+    return setting == 'Medium'
 
 
 def convert(color):
@@ -71,7 +83,51 @@ def convert(color):
     list
         a list representing RBG color code in format (0-255, 0-255, 0-255)
     """
-    return [int(x * 255) for x in color]
+    return list(convert_tuple(color))
+
+
+def convert_tuple(color):
+    """Return (0-255, 0-255, 0-255) color code as tuple.
+
+    Colors from COLORS are taken from precomputed CONVERTED table, others are
+    calculated. Returned tuple should not be modified by caller.
+
+    Parameters
+    ----------
+    color : tuple
+        RGB code in format (0-1, 0-1, 0-1)
+
+    Returns
+    -------
+    tuple
+        a tuple representing RBG color code in format (0-255, 0-255, 0-255)
+    """
+    try:
+        return CONVERTED[color]
+    except (KeyError, TypeError):
+        return int(color[0] * 255), int(color[1] * 255), int(color[2] * 255)
+
+
+def get_random_colors(amount, table=COLORS):
+    """Return list of randomly picked colors (grey is never picked).
+
+    Each color is picked independently - same as calling get_color() method
+    of new `Random` object for each element, but in one call.
+
+    Parameters
+    ----------
+    amount : int
+        Number of colors to pick.
+    table : dict, optional
+        Dictionary with color codes which will be returned - COLORS (0-1,
+        0-1, 0-1) or COLORS_255 (0-255, 0-255, 0-255) (default is COLORS).
+
+    Returns
+    -------
+    list
+        a list with color codes in RGB format taken from table
+    """
+    return [table[x] for x in GENERATOR.choices(OTHERS['Grey'], k=amount)]
 
 
 def get_menu_colors():
@@ -122,30 +178,35 @@ class Random:
     ----------
     active_color : str
         string containing color picked last time (default grey)
+    choice : function
+        bound `choice` method of module GENERATOR (`random.Random`) used to
+        pick colors
 
     Methods
     -------
-    get_random_color()
+    get_color()
         Picks one random color (different than last choice) from dictionary
         and return its RGB code.
     """
 
+    __slots__ = ('active_color', 'choice')
+
     def __init__(self):
-        """Set attribute active_color to grey."""
+        """Set attribute active_color to grey and bind color generator."""
         self.active_color = 'Grey'
+        self.choice = GENERATOR.choice
 
     def __repr__(self):
         """Return `Random` class representation."""
-        colors = [x for x in COLORS.keys() if not x == self.active_color]
+        colors = list(OTHERS[self.active_color])
         return f'<One color code of {colors} picked randomly>'
 
     def get_color(self):
         """Return random color.
 
         Pick one color from COLORS different than active_color (color chosen
-        last time). Updates active_color and return picked color code in RGB
-        format (0-1, 0-1, 0-1).
+        last time) using precomputed OTHERS table. Updates active_color and
+        return picked color code in RGB format (0-1, 0-1, 0-1).
         """
-        colors = list(filter((lambda x: self.active_color not in x), COLORS))
-        self.active_color = choice(colors)
+        self.active_color = self.choice(OTHERS[self.active_color])
         return COLORS[self.active_color]
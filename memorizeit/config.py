@@ -20,7 +20,30 @@ from pathlib import Path
 import sys
 
 import pygame
-from pygame.locals import KEYDOWN, K_ESCAPE
+from pygame.locals import KEYDOWN, K_ESCAPE, OPENGL, QUIT, USEREVENT
+
+CONFIG_FILE = Path(__file__).parent.absolute() / 'settings.json'
+
+DEFAULTS = {
+    'figures': 3,
+    'time': 60,
+    'speed': 2,
+    'colors': 'Medium',
+    'sound': 'Off'
+}
+
+RANGE = {
+    'figures': (2, 3, 4),
+    'time': (5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60),
+    'speed': (1, 2, 3, 4),
+    'colors': ('Easy', 'Medium', 'Hard'),
+    'sound': ('Off', 'On')
+}
+
+INDEX = {
+    key: {value: index for index, value in enumerate(allowed)}
+    for key, allowed in RANGE.items()
+}
 
 
 class Config:
@@ -31,30 +54,41 @@ class Config:
 
     Attributes
     ----------
-    config_file : str
-        string containing configuration file path
+    config_file : pathlib.Path
+        configuration file path
+    range : dict
+        class attribute - dictionary with allowed values of each setting
+        (module level RANGE, shared by all instances)
+    index : dict
+        class attribute - dictionary with position of each allowed value in
+        range of its setting (module level INDEX)
     settings : dict
         dictionary with loaded and checked settings
+    loaded : tuple
+        class attribute shared by all instances - modification time of
+        configuration file and its parsed content. Allows to skip reading and
+        parsing file again when it wasn't changed since last time.
     """
 
+    __slots__ = ('config_file', 'settings')
+
+    range = RANGE
+    index = INDEX
+    loaded = (None, False)
+
     def __init__(self):
         """Load, check and store settings.
 
         It has defined config_file name. Settings are loaded from this file.
         Then they are checked with default values. Correct settings are kept
-        in variable and saved to file (to replace corrupted data if there were
-        any wrong values).
+        in variable and saved to file only if they differ from loaded ones (to
+        replace corrupted data if there were any wrong values).
         """
-        self.config_file = Path(__file__).parent.absolute() / 'settings.json'
-        self.range = {
-            'figures': (2, 3, 4),
-            'time': tuple((x for x in range(5, 61, 5))),
-            'speed': (1, 2, 3, 4),
-            'colors': ('Easy', 'Medium', 'Hard'),
-            'sound': ('Off', 'On')
-        }
-        self.settings = self.check_content(self.get_content())
-        self.save(self.settings)
+        self.config_file = CONFIG_FILE
+        content = self.get_content()
+        self.settings = self.check_content(content)
+        if content != self.settings:
+            self.save(self.settings)
 
     def __repr__(self):
         """Return `Config` class representation."""
@@ -63,41 +97,44 @@ class Config:
     def check_content(self, content):
         """Return dictionary with correct values of settings.
 
-        It iterates through default dictionary and compares values passed in
-        content with allowed values. If value is accepted function replaces
-        default value. Modified dictionary is returned.
+        It iterates through copy of DEFAULTS dictionary and compares values
+        passed in content with allowed values. If value is accepted function
+        replaces default value. Modified dictionary is returned.
 
         Parameters
         ----------
-        content : dict
-            a dictionary which will be checked
+        content : dict or False
+            a dictionary which will be checked (anything else is replaced
+            with default settings)
 
         Returns
         -------
         dict
             a dictionary with correct settings
         """
-        default = {
-            'figures': 3,
-            'time': 60,
-            'speed': 2,
-            'colors': 'Medium',
-            'sound': 'Off'
-        }
-        for key in default:
-            try:
-                if content[key] in self.range[key]:
-                    default[key] = content[key]
-            except (KeyError, TypeError):
-                pass
+        default = DEFAULTS.copy()
+        if not isinstance(content, dict):
+            return default
+        for key, allowed in self.range.items():
+            value = content.get(key)
+            if value in allowed:
+                default[key] = value
         return default
 
     def get_content(self):
-        """Return content of configuration file or False in case of error."""
+        """Return content of configuration file or False in case of error.
+
+        File is read and parsed only when its modification time differs from
+        the one stored in loaded class attribute, otherwise cached content is
+        returned.
+        """
         try:
-            with open(self.config_file, 'r') as config:
-                return loads(config.read())
-        except (FileNotFoundError, ValueError):
+            modified = self.config_file.stat().st_mtime_ns
+            if Config.loaded[0] != modified:
+                with open(self.config_file, 'rb') as config:
+                    Config.loaded = (modified, loads(config.read()))
+            return Config.loaded[1]
+        except (OSError, ValueError):
             return False
 
     def save(self, settings):
@@ -109,8 +146,9 @@ class Config:
             dictionary settings which will be saved to configuration file
         """
         self.settings = settings
-        with open(self.config_file, 'w') as config:
-            config.write(dumps(self.settings))
+        with open(self.config_file, 'wb') as config:
+            config.write(dumps(self.settings).encode())
+        Config.loaded = (self.config_file.stat().st_mtime_ns, dict(settings))
 
     def get_settings(self):
         """Return correct settings in dictionary.
@@ -132,55 +170,186 @@ class Handler:
     ----------
     function : function
         function which will be run inside loop
-    condition : function
-        function which return True or False based on its condition
+    condition : function or None
+        function which return True or False based on its condition, None if
+        loop should run until stop() is called
+    running : bool
+        False when loop was stopped by stop() method
+    is_menu : bool
+        True if function is main menu - escape key closes application then
+    present : function
+        `pygame.display.flip` for `OpenGL` display else
+        `pygame.display.update` - chosen once when Handler is created
+    wait : bool
+        True if loop runs until stop() is called (menus) - it waits for
+        events then instead of polling them and function is called only when
+        something happened
+    FPS : int
+        class attribute - number of frames per second - waiting loop is woken
+        by timer event that often and games limit their loop to it
+    TICK : int
+        class attribute - type of timer event which wakes waiting loop FPS
+        times per second (holding mouse button still repeats clicks)
+    timer : int
+        class attribute - interval (ms) of currently set TICK timer, 0 when
+        it is off. Each loop sets its own timer and restores previous one
+        when it ends, so enclosing menu keeps its timer, while games and
+        closed application don't get timer events
 
     Methods
     -------
     call()
-        loops passed functions and handles `pygame` events
+        loops passed functions and handles `pygame` events, screen is not
+        refreshed when looped function returns False (nothing changed)
+    get_events()
+        waits for `pygame` events and returns them with information if mouse
+        button is pressed and if anything else than timer happened
+    close(event)
+        shuts down application
+    press_key(event)
+        stops Handler (or closes application from main menu) on escape key
+    get_present()
+        returns function refreshing screen which is supported by display
+    set_timer(interval)
+        sets TICK timer to interval (ms) if it differs from current one
     stop()
         breaks loop and stops Handler from running
     """
 
-    def __init__(self, function, condition=lambda: True):
+    __slots__ = ('function', 'condition', 'running', 'is_menu', 'present',
+                 'wait')
+
+    FPS = 60
+    TICK = USEREVENT
+    timer = 0
+
+    def __init__(self, function, condition=None):
         """Initialize event handler.
 
         Parameters
         ----------
         function : function
             function which will be run inside loop
-        condition : function, optional
+        condition : function, None, optional
             function which return True or False based on its condition
-            (default is lambda: True)
+            (default is None - loop runs until stop() is called)
         """
         self.function = function
         self.condition = condition
+        self.running = True
+        self.is_menu = type(function).__name__ == 'Menu'
+        self.present = self.get_present()
+        self.wait = condition is None
 
     def __repr__(self):
         """Return `Handler` class representation."""
         return f'<Pygame event handler with {self.function} in loop.'
 
     def __call__(self):
-        """Loops passed functions and handles `pygame` events."""
-        while self.condition():
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == KEYDOWN:
-                    if event.key == K_ESCAPE:
-                        if self.function.__class__.__name__ == 'Menu':
-                            pygame.quit()
-                            sys.exit()
-                        self.stop()
-            self.function()
-
-            try:
-                pygame.display.update()
-            except pygame.error:
-                pygame.display.flip()
+        """Loops passed functions and handles `pygame` events.
+
+        Functions used in loop are bound to local names once before it starts.
+        Screen is refreshed after each call of passed function unless it
+        returns False which means nothing was drawn since last refresh (or
+        function already refreshed changed areas itself).
+        Running flag is read from attribute each time because stop() may be
+        called by looped function. Waiting loop sleeps until event arrives
+        and skips calling function when there was nothing but timer event.
+        Timer is on only while waiting loop runs - timer of enclosing loop is
+        restored when this one ends.
+        """
+        get_events = pygame.event.get
+        present = self.present
+        function = self.function
+        condition = self.condition
+        dispatch = {QUIT: self.close, KEYDOWN: self.press_key}.get
+        previous = Handler.timer
+        self.set_timer(1000 // self.FPS if self.wait else 0)
+        dirty = True
+
+        try:
+            while self.running and (condition is None or condition()):
+                if self.wait:
+                    events, pressed, changed = self.get_events()
+                    call = dirty or pressed or changed
+                    dirty = pressed
+                else:
+                    events, call = get_events(), True
+                for event in events:
+                    handle = dispatch(event.type)
+                    if handle is not None:
+                        handle(event)
+                if call and function() is not False:
+                    present()
+        finally:
+            self.set_timer(previous)
+
+    def get_events(self):
+        """Wait for `pygame` events and return them.
+
+        Thread sleeps until any event (at least timer one) arrives. Mouse
+        button state is returned, because clicked element may replace screen
+        content - function is called then also in next loop to draw it again.
+
+        Returns
+        -------
+        tuple
+            a list with `pygame` events, True if left mouse button is pressed
+            and True if there was any event other than timer
+        """
+        events = pygame.event.get()
+        if not events:
+            events = [pygame.event.wait()]
+        pressed = pygame.mouse.get_pressed()[0]
+        changed = any(event.type != self.TICK for event in events)
+        return events, pressed, changed
+
+    @staticmethod
+    def close(event=None):
+        """Shut down application."""
+        pygame.quit()
+        sys.exit()
+
+    def press_key(self, event):
+        """Handle pressed key - escape stops `Handler` or closes main menu.
+
+        Parameters
+        ----------
+        event : pygame.event.Event
+            `pygame` KEYDOWN event
+        """
+        if event.key == K_ESCAPE:
+            if self.is_menu:
+                self.close()
+            self.stop()
+
+    @staticmethod
+    def get_present():
+        """Return function refreshing screen supported by current display.
+
+        `OpenGL` display can't be updated with `pygame.display.update` so
+        `pygame.display.flip` is used then (also if there is no display yet).
+        """
+        surface = pygame.display.get_surface()
+        if surface is None or surface.get_flags() & OPENGL:
+            return pygame.display.flip
+        return pygame.display.update
+
+    def set_timer(self, interval):
+        """Set TICK timer to passed interval if it differs from current one.
+
+        Nothing is done when `pygame` was already shut down (application is
+        being closed).
+
+        Parameters
+        ----------
+        interval : int
+            time (ms) between timer events, 0 turns timer off
+        """
+        if interval != Handler.timer and pygame.get_init():
+            pygame.time.set_timer(self.TICK, interval)
+            Handler.timer = interval
 
     def stop(self):
         """Break loop and stop `Handler` from running."""
-        self.condition = lambda: False
+        self.running = False
@@ -15,10 +15,19 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from OpenGL.GL import (glBegin, glColor3fv, glVertex3fv, glEnd,
-                       GL_LINES, GL_QUADS)
+from bisect import bisect
+from ctypes import sizeof
+from functools import lru_cache
+from itertools import accumulate, chain
+
+from OpenGL.GL import (glBindBuffer, glBufferData, glColorPointer,
+                       glDeleteBuffers, glDisableClientState, glDrawElements,
+                       glEnableClientState, glGenBuffers, glVertexPointer,
+                       GLfloat, GLushort, GL_ARRAY_BUFFER, GL_COLOR_ARRAY,
+                       GL_ELEMENT_ARRAY_BUFFER, GL_FLOAT, GL_LINES, GL_QUADS,
+                       GL_STATIC_DRAW, GL_UNSIGNED_SHORT, GL_VERTEX_ARRAY)
 import pygame
-from random import choice, choices, randrange, randint, sample
+from random import choice, choices, random, randrange, randint, sample
 
 from memorizeit import colors
 
@@ -28,7 +37,7 @@ class Wave:
     A class with collection of the same methods both for Wave2D and Wave3D.
 
     It is base, responsible for creating wave of elements, iterating through
-    its objects, counting and calling them (drawing).
+    its objects and counting them. Drawing is done by Wave2D and Wave3D.
 
     ...
 
@@ -45,6 +54,8 @@ class Wave:
         and Wave3D
     """
 
+    __slots__ = ('figure', 'figures')
+
     def __init__(self, figure_type, color, *args):
         """Initialize wave.
 
@@ -71,17 +82,12 @@ class Wave:
 
     def __iter__(self):
         """Iterate through wave figures."""
-        return (x for x in self.figures)
+        return iter(self.figures)
 
     def __len__(self):
         """Return number of wave figures."""
         return len(self.figures)
 
-    def __call__(self):
-        """Spawn (display) wave on screen."""
-        for figure in self:
-            figure()
-
 
 class Wave2D(Wave):
     """
@@ -93,6 +99,20 @@ class Wave2D(Wave):
 
     ...
 
+    Attributes
+    ----------
+    screen : pygame.Surface
+        object representing game screen where wave figures are binded
+    blits : list
+        list of (image, position) pairs when wave displays photos or figures
+        in one color (drawn once on template surface) - they are blitted to
+        screen at once
+    polygons : list
+        list of (color, points) pairs of figures in random colors - they are
+        passed straight to `pygame.draw.polygon`
+    weights : tuple
+        class attribute with cumulative weights of picking 1 to 9 elements
+
     Methods
     -------
     get_amount()
@@ -105,21 +125,54 @@ class Wave2D(Wave):
         according to resolution of screen - tuple (width, height) return
         integer with size of figure
     fill(color, screen, resolution)
-        populates figures list with 2D figures objects binded to screen
-        (`pygame.Surface`). Use wave color or photo if it is passed else pick
-        random color for each element. Resolution is used to set figure size
-        and region of screen where it will be displayed
+        populates figures list with 2D figures objects, wave is binded to
+        screen (`pygame.Surface`). Use wave color or photo if it is passed
+        else pick random color for each element. Resolution is used to set
+        figure size and region of screen where it will be displayed
+    get_template(figure, size, color)
+        returns transparent surface with figure drawn in set color
+    call()
+        spawns (displays) wave on screen - photos and figures in one color
+        with one `blits` call
     """
 
+    __slots__ = ('screen', 'blits', 'polygons')
+
+    def __call__(self):
+        """Spawn (display) wave on screen.
+
+        Photos and figures in one color are blitted to screen at once, figures
+        in random colors are drawn one by one from prepared polygons list
+        while screen stays locked.
+        """
+        if self.blits:
+            self.screen.blits(self.blits, False)
+        else:
+            screen = self.screen
+            polygon = pygame.draw.polygon
+            screen.lock()
+            try:
+                for color, points in self.polygons:
+                    polygon(screen, color, points)
+            finally:
+                screen.unlock()
+
+    weights = tuple(accumulate(
+        (0.03, 0.1, 0.2, 0.2, 0.2, 0.15, 0.1, 0.01, 0.01)
+    ))
+
     @staticmethod
     def get_amount():
-        """Pick random number of elements from 1 to 9 according to weights."""
-        return choices(
-            range(1, 10),
-            weights=[0.03, 0.1, 0.2, 0.2, 0.2, 0.15, 0.1, 0.01, 0.01]
-        )[0]
+        """Pick random number of elements from 1 to 9 according to weights.
+
+        Cumulative weights are computed once (weights class attribute), so
+        picking is one bisection of random value.
+        """
+        weights = Wave2D.weights
+        return bisect(weights, random() * weights[-1]) + 1
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_mid_points(resolution):
         """Divide screen in net 3x3 and return middle point of each field.
 
@@ -131,16 +184,17 @@ class Wave2D(Wave):
 
         Returns
         -------
-        list
-            a list with 9 positions (screen divided in net 3x3) - middle point
-            of each part of divided screen
+        tuple
+            a tuple with 9 positions (screen divided in net 3x3) - middle point
+            of each part of divided screen. Result is cached per resolution.
         """
         w, h = resolution
-        return [(int(x), int(y))
-                for x in (w / 6, w / 2, w - w / 6)
-                for y in (h / 6, h / 2, h - h / 6)]
+        return tuple((x, y)
+                     for x in (w // 6, w // 2, w - w // 6)
+                     for y in (h // 6, h // 2, h - h // 6))
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_figure_size(resolution):
         """Return size of figure (used in drawing).
 
@@ -153,15 +207,14 @@ class Wave2D(Wave):
         Returns
         -------
         int
-            size of figure which will be drawn
+            size of figure which will be drawn (cached per resolution)
         """
-        w, h = resolution
-        return int(min(w / 3, h / 3) / 4)
+        return min(resolution) // 12
 
     def fill(self, color, screen, resolution):
         """Populate figures list.
 
-        2D figures objects are created and binded to screen
+        2D figures objects are created and wave is binded to screen
         (`pygame.Surface`). It uses wave color (RGB code (0-1, 0-1, 0-1) which
         is converted to (0-255, 0-255, 0-255)) or photo if it is passed else
         it picks random color for each element. Resolution is used to set
@@ -182,18 +235,63 @@ class Wave2D(Wave):
             a tuple with two int values - width, height - according to
             resolution of used monitor
         """
-        for point in sample(
-                self.get_mid_points(resolution), self.get_amount()):
-            figure_color = color if color else colors.Random().get_color()
-
-            if not isinstance(color, pygame.Surface):
-                figure_color = colors.convert(figure_color)
+        if isinstance(color, tuple):
+            color = colors.convert_tuple(color)
+        size = self.get_figure_size(resolution)
+        points = sample(self.get_mid_points(resolution), self.get_amount())
+        if color:
+            figure_colors = [color] * len(points)
+        else:
+            figure_colors = colors.get_random_colors(len(points),
+                                                     colors.COLORS_255)
 
+        for point, figure_color in zip(points, figure_colors):
             self.figures.append(
-                Figure2D(screen, self.figure, figure_color, point,
-                         self.get_figure_size(resolution))
+                Figure2D(self.figure, figure_color, point, size)
             )
 
+        self.screen = screen
+        self.blits = []
+        self.polygons = []
+        if isinstance(color, pygame.Surface):
+            self.blits = [(color, x.points) for x in self.figures]
+        elif color:
+            template = self.get_template(self.figure, size, color)
+            self.blits = [(template, (x - size, y - size)) for x, y in points]
+        else:
+            self.polygons = [(x.color, x.points) for x in self.figures]
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_template(figure, size, color):
+        """Return surface with figure drawn in set color.
+
+        It is used to blit figures of wave in one color instead of drawing
+        each of them. Surface is cached, so it is drawn only once for each
+        figure, size and color.
+
+        Parameters
+        ----------
+        figure : str
+            name of figure which will be drawn
+        size : int
+            size of figure which will be drawn
+        color : tuple
+            RGB color code represented as (0-255, 0-255, 0-255) values (must
+            be hashable)
+
+        Returns
+        -------
+        pygame.Surface
+            transparent surface (2 * size + 1 wide and high) with figure drawn
+            in its center
+        """
+        template = pygame.Surface((2 * size + 1, 2 * size + 1),
+                                  pygame.SRCALPHA)
+        points = Figure2D.SHAPES[figure]((size, size), size)
+        pygame.draw.polygon(template, color, points)
+        return template
+
 
 class Wave3D(Wave):
     """
@@ -203,6 +301,19 @@ class Wave3D(Wave):
 
     ...
 
+    Attributes
+    ----------
+    arrays : tuple
+        `ctypes` arrays with vertices (shifted to points), colors and indices
+        of all wave figures merged together
+    buffers : tuple or None
+        `OpenGL` buffers created from arrays at first draw (None before) -
+        vertices, colors and indices buffer (there is no colors buffer in
+        fire mode)
+    farthest : float
+        the lowest Z value of wave vertices - when camera passes it whole
+        wave is behind camera
+
     Methods
     -------
     fill(color, position)
@@ -210,8 +321,78 @@ class Wave3D(Wave):
         must be specified (how far from beginning figure will be drawn). It
         uses wave color if it is passed else picks random color for each
         element.
+    call()
+        spawns (displays) wave on screen with one `glDrawElements` call
+    create_buffers()
+        uploads merged arrays of wave figures to `OpenGL` buffers
+    is_behind(camera_z)
+        checks if whole wave is behind camera, so it doesn't have to be drawn
+    release()
+        deletes `OpenGL` buffers of wave
     """
 
+    __slots__ = ('arrays', 'buffers', 'farthest')
+
+    def __call__(self):
+        """Spawn (display) wave on screen.
+
+        All figures in wave have the same class and mode, so they are merged
+        in one set of buffers and drawn at once. Figures with random color of
+        each vertex (fire mode) get new colors array each time.
+        """
+        if not self.figures:
+            return
+        if self.buffers is None:
+            self.buffers = self.create_buffers()
+        figure = self.figures[0]
+
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, self.buffers[0])
+        glVertexPointer(3, GL_FLOAT, 0, None)
+        if figure.multicolor:
+            picked = choices(figure.color, k=len(self.arrays[0]) // 3)
+            values = list(chain.from_iterable(picked))
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            glColorPointer(3, GL_FLOAT, 0, (GLfloat * len(values))(*values))
+        else:
+            glBindBuffer(GL_ARRAY_BUFFER, self.buffers[1])
+            glColorPointer(3, GL_FLOAT, 0, None)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.buffers[-1])
+        glDrawElements(figure.mode, len(self.arrays[2]), GL_UNSIGNED_SHORT,
+                       None)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+    def create_buffers(self):
+        """Upload merged arrays of wave figures to `OpenGL` buffers.
+
+        Colors buffer isn't created in fire mode, because colors of its
+        vertices are picked again each time wave is drawn.
+
+        Returns
+        -------
+        tuple
+            vertices, colors (only when not in fire mode) and indices buffers
+        """
+        vertices, vertices_colors, indices = self.arrays
+        uploads = [(GL_ARRAY_BUFFER, vertices)]
+        if not self.figures[0].multicolor:
+            uploads.append((GL_ARRAY_BUFFER, vertices_colors))
+        uploads.append((GL_ELEMENT_ARRAY_BUFFER, indices))
+
+        buffers = tuple(glGenBuffers(len(uploads)))
+        for (target, array), buffer in zip(uploads, buffers):
+            glBindBuffer(target, buffer)
+            glBufferData(target, sizeof(array), array, GL_STATIC_DRAW)
+        return buffers
+
+    def release(self):
+        """Delete `OpenGL` buffers of wave if they were created."""
+        if self.buffers is not None:
+            glDeleteBuffers(len(self.buffers), self.buffers)
+            self.buffers = None
+
     def fill(self, color, position_z):
         """Populate figures list.
 
@@ -222,7 +403,9 @@ class Wave3D(Wave):
         documentation as I do): there is also available fire mode (see
         Figure3D fire @classmethod) which will simulate flames. Be aware that
         each object will be colored same way. Replace `.normal` with `.fire`
-        in loop below - where objects are created.
+        in loop below - where objects are created. At the end vertices,
+        colors and indices of all figures are merged into arrays attribute,
+        so whole wave can be drawn at once.
 
         Parameters
         ----------
@@ -234,40 +417,71 @@ class Wave3D(Wave):
             position of camera Z where figure will be drawn (how far from
             beginning - where camera started to move)
         """
-        for _ in range(randint(2, 6)):
-            figure_color = color if color else colors.Random().get_color()
+        figure = FIGURES[self.figure]
+        amount = randint(2, 6)
+        if color:
+            figure_colors = [color] * amount
+        else:
+            figure_colors = colors.get_random_colors(amount)
+
+        for figure_color in figure_colors:
+            self.figures.append(figure.normal(position_z, figure_color))
+
+        vertices, vertices_colors, indices = [], [], []
+        for element in self:
+            offset = len(vertices)
+            indices.extend(offset + x for x in element.arrays[element.mode])
+            vertices.extend(element.vertices)
+            if not element.multicolor:
+                vertices_colors.extend([element.color] * len(element.vertices))
+        self.arrays = (Figure3D.flatten(vertices, GLfloat),
+                       Figure3D.flatten(vertices_colors, GLfloat),
+                       (GLushort * len(indices))(*indices))
+        self.buffers = None
+        self.farthest = min((z for _, _, z in vertices), default=position_z)
+
+    def is_behind(self, camera_z):
+        """Return True if all wave figures are behind camera.
 
-            self.figures.append(
-                eval(self.figure).normal(position_z, figure_color)
-            )
+        Parameters
+        ----------
+        camera_z : float
+            Z position of camera in the world
+        """
+        return self.farthest > camera_z
 
 
 class Figure2D:
     """
     A class with methods allowing to display 2D figures on screen.
 
+    It holds color and points of figure, which are drawn on screen by
+    Wave2D together with other figures of wave.
+
     ...
 
     Attributes
     ----------
-    screen: pygame.Surface
-        object representing game screen where created figure will be binded
     figure : str
         name of created figure
     color : tuple or pygame.Surface
         RGB color code represented as (0-255, 0-255, 0-255) values,
         pygame.Surface if photo is used
-    points : list
-        list with points needed to draw figure
+    points : list or pygame.Rect
+        list with points needed to draw figure or `pygame.Rect` where photo
+        is displayed
+    SHAPES : dict
+        class attribute with names of figures and functions returning points
+        needed to draw them
     """
 
-    def __init__(self, screen, figure, color, mid_point, size):
+    __slots__ = ('figure', 'color', 'points')
+
+    def __init__(self, figure, color, mid_point, size):
         """Initialize 2D figure.
 
         Parameters
         ----------
-        screen: pygame.Surface
-            object representing game screen where created figure will be binded
         figure : str
             name of created figure
         color : tuple or pygame.Surface
@@ -278,7 +492,6 @@ class Figure2D:
         size : int
             size of figure which will be drawn
         """
-        self.screen = screen
         self.figure = figure
         self.color = color
         self.points = self.adjust_points(mid_point, size)
@@ -287,13 +500,6 @@ class Figure2D:
         """Return `Figure2D` class representation."""
         return f'<{self.figure} with points: {self.points}>'
 
-    def __call__(self):
-        """Draw figure or displays photo on screen."""
-        if isinstance(self.color, pygame.Surface):
-            self.screen.blit(self.color, self.points)
-        else:
-            pygame.draw.polygon(self.screen, self.color, self.points)
-
     def adjust_points(self, mid_point, size):
         """Return points needed to display element.
 
@@ -306,14 +512,15 @@ class Figure2D:
 
         Returns
         -------
-        list
-            list with points needed to draw or display element on screen (each
-            has width and height value)
+        list or pygame.Rect
+            list with points needed to draw element on screen (each has width
+            and height value) or `pygame.Rect` where photo will be displayed
         """
         if isinstance(self.color, pygame.Surface):
             w, h = self.color.get_size()
-            return [int(mid_point[0] - w / 2), int(mid_point[1] - h / 2)]
-        return eval('self.get_' + self.figure + '_points')(mid_point, size)
+            return pygame.Rect(mid_point[0] - w // 2, mid_point[1] - h // 2,
+                               w, h)
+        return self.SHAPES[self.figure](mid_point, size)
 
     @staticmethod
     def get_diamond_points(mid_point, size):
@@ -354,8 +561,8 @@ class Figure2D:
             and height value)
         """
         x, y = mid_point
-        s = size
-        return [(x - s, y - s), (x - s, y + s), (x + s, y + s), (x + s, y - s)]
+        left, right, top, bottom = x - size, x + size, y - size, y + size
+        return [(left, top), (left, bottom), (right, bottom), (right, top)]
 
     @staticmethod
     def get_triangle_points(mid_point, size):
@@ -396,10 +603,20 @@ class Figure2D:
             and height value)
         """
         x, y = mid_point
-        s = size
-        return [(x - s, y + s / 2), (x - s, y - s / 2), (x - s / 2, y - s),
-                (x + s / 2, y - s), (x + s, y - s / 2), (x + s, y + s / 2),
-                (x + s / 2, y + s), (x - s / 2, y + s)]
+        h = size // 2
+        left, right, top, bottom = x - size, x + size, y - size, y + size
+        inner_left, inner_right = x - h, x + h
+        inner_top, inner_bottom = y - h, y + h
+        return [(left, inner_bottom), (left, inner_top), (inner_left, top),
+                (inner_right, top), (right, inner_top), (right, inner_bottom),
+                (inner_right, bottom), (inner_left, bottom)]
+
+    SHAPES = {
+        'diamond': get_diamond_points.__func__,
+        'square': get_square_points.__func__,
+        'triangle': get_triangle_points.__func__,
+        'octagon': get_octagon_points.__func__
+    }
 
 
 class Figure3D:
@@ -414,14 +631,28 @@ class Figure3D:
         RGB color code represented as (0-1, 0-1, 0-1) values
     mode : OpenGL.constant.IntConstant
         mode used to draw figures in 3D - GL_LINES or GL_QUADS
-    operation : function
-        method used in specified mode to provide values needed to draw figure
-        - get_edges or get_surfaces
+    multicolor : bool
+        True if color contains several color codes picked randomly for each
+        vertex
     vertices : list
-        list filled with vertices needed to draw figure
+        list filled with vertices needed to draw figure (shifted to random
+        point)
+    VERTICES : tuple
+        class attribute of each figure class with its vertices (x, y, z)
+    EDGES : tuple
+        class attribute of each figure class with pairs of vertices indices
+        connected by edge
+    SURFACES : tuple
+        class attribute of each figure class with vertices indices of each
+        surface
+    arrays : dict
+        class attribute of each figure class with its edges and surfaces
+        flattened to `ctypes` arrays (GL_LINES and GL_QUADS key)
     """
 
-    def __init__(self, position_z, color, mode, operation):
+    __slots__ = ('color', 'mode', 'multicolor', 'vertices')
+
+    def __init__(self, position_z, color, mode):
         """Initialize 3D figure.
 
         Parameters
@@ -433,41 +664,45 @@ class Figure3D:
             RGB color code represented as (0-1, 0-1, 0-1) values
         mode : OpenGL.constant.IntConstant
             mode used to draw figures in 3D - GL_LINES or GL_QUADS
-        operation : function
-            method used in specified mode to provide values needed to draw
-            figure - get_edges or get_surfaces
         """
         self.color = color
         self.mode = mode
-        self.operation = operation
-        self.vertices = self.adjust_vertices(self.get_random_shift(position_z))
+        self.multicolor = all(isinstance(x, tuple) for x in color)
+        point = self.get_random_shift(position_z)
+        self.vertices = self.adjust_vertices(point)
 
     def __repr__(self):
         """Return `Figure3D` class representation."""
         return f'<{self.__class__.__name__} with vertices: {self.vertices}>'
 
-    def __call__(self):
-        """Display figure on screen."""
-        glBegin(self.mode)
-        for element in self.operation():
-            for vertex in element:
-                color = choice(self.color) if all(
-                    [isinstance(x, tuple) for x in self.color]
-                ) else self.color
-                glColor3fv(color)
-                glVertex3fv(self.vertices[vertex])
-        glEnd()
+    def __init_subclass__(cls, **kwargs):
+        """Flatten edges and surfaces of figure class once.
+
+        They are stored as `ctypes` arrays in arrays class attribute (edges
+        under GL_LINES and surfaces under GL_QUADS key) ready to be merged by
+        `Wave3D`.
+        """
+        super().__init_subclass__(**kwargs)
+        cls.arrays = {
+            GL_LINES: cls.flatten(cls.EDGES, GLushort),
+            GL_QUADS: cls.flatten(cls.SURFACES, GLushort)
+        }
+
+    @staticmethod
+    def flatten(elements, data_type):
+        """Return nested tuples flattened to `ctypes` array of set type."""
+        values = [x for element in elements for x in element]
+        return (data_type * len(values))(*values)
 
     @classmethod
     def normal(cls, position_z, color, *args):
         """Set class parameters to draw contour of figure in set color."""
-        return cls(position_z, color, GL_LINES, cls.get_edges)
+        return cls(position_z, color, GL_LINES)
 
     @classmethod
     def fire(cls, position_z, *args):
         """Set class parameters to draws full figure imitating flame."""
-        return cls(position_z, ((0.5, 0, 0), (1, 0.5, 0)),
-                   GL_QUADS, cls.get_surfaces)
+        return cls(position_z, ((0.5, 0, 0), (1, 0.5, 0)), GL_QUADS)
 
     @staticmethod
     def get_random_shift(position_z):
@@ -503,219 +738,193 @@ class Figure3D:
         list
             containing new vertices values allowing to draw 3D figure
         """
-        new_vertices = []
-        for vertice in self.get_vertices():
-            new = []
-            new.append(vertice[0] + point[0])
-            new.append(vertice[1] + point[1])
-            new.append(vertice[2] + point[2])
-            new_vertices.append(new)
-        return new_vertices
+        x, y, z = point
+        return [(vx + x, vy + y, vz + z) for vx, vy, vz in self.VERTICES]
 
 
 class Cube(Figure3D):
     """A class representing cube. It extends Figure3D."""
 
-    @staticmethod
-    def get_vertices():
-        """Return figure vertices."""
-        return (
-            (1, -1, -1),
-            (1, 1, -1),
-            (-1, 1, -1),
-            (-1, -1, -1),
-            (1, -1, 1),
-            (1, 1, 1),
-            (-1, -1, 1),
-            (-1, 1, 1)
-        )
-
-    @staticmethod
-    def get_edges():
-        """Return figure edges."""
-        return (
-            (0, 1),
-            (0, 3),
-            (0, 4),
-            (2, 1),
-            (2, 3),
-            (2, 7),
-            (6, 3),
-            (6, 4),
-            (6, 7),
-            (5, 1),
-            (5, 4),
-            (5, 7)
-        )
-
-    @staticmethod
-    def get_surfaces():
-        """Return figure surfaces."""
-        return (
-            (0, 1, 2, 3),
-            (3, 2, 7, 6),
-            (6, 7, 5, 4),
-            (4, 5, 1, 0),
-            (1, 5, 7, 2),
-            (4, 0, 3, 6)
-        )
+    __slots__ = ()
+
+    VERTICES = (
+        (1, -1, -1),
+        (1, 1, -1),
+        (-1, 1, -1),
+        (-1, -1, -1),
+        (1, -1, 1),
+        (1, 1, 1),
+        (-1, -1, 1),
+        (-1, 1, 1)
+    )
+
+    EDGES = (
+        (0, 1),
+        (0, 3),
+        (0, 4),
+        (2, 1),
+        (2, 3),
+        (2, 7),
+        (6, 3),
+        (6, 4),
+        (6, 7),
+        (5, 1),
+        (5, 4),
+        (5, 7)
+    )
+
+    SURFACES = (
+        (0, 1, 2, 3),
+        (3, 2, 7, 6),
+        (6, 7, 5, 4),
+        (4, 5, 1, 0),
+        (1, 5, 7, 2),
+        (4, 0, 3, 6)
+    )
 
 
 class Octagon(Figure3D):
     """A class representing octagon. It extends Figure3D."""
 
-    @staticmethod
-    def get_vertices():
-        """Return figure vertices."""
-        return (
-            (-0.25, 0, -0.5),
-            (0.25, 0, -0.5),
-            (0.5, 0, -0.25),
-            (0.5, 0, 0.25),
-            (0.25, 0, 0.5),
-            (-0.25, 0, 0.5),
-            (-0.5, 0, 0.25),
-            (-0.5, 0, -0.25),
-            (-0.25, 1, -0.5),
-            (0.25, 1, -0.5),
-            (0.5, 1, -0.25),
-            (0.5, 1, 0.25),
-            (0.25, 1, 0.5),
-            (-0.25, 1, 0.5),
-            (-0.5, 1, 0.25),
-            (-0.5, 1, -0.25)
-        )
-
-    @staticmethod
-    def get_edges():
-        """Return figure edges."""
-        return (
-            (0, 7),
-            (0, 1),
-            (1, 2),
-            (2, 3),
-            (3, 4),
-            (4, 5),
-            (5, 6),
-            (6, 7),
-            (8, 15),
-            (8, 9),
-            (9, 10),
-            (10, 11),
-            (11, 12),
-            (12, 13),
-            (13, 14),
-            (14, 15),
-            (0, 8),
-            (1, 9),
-            (2, 10),
-            (3, 11),
-            (4, 12),
-            (5, 13),
-            (6, 14),
-            (7, 15)
-        )
-
-    @staticmethod
-    def get_surfaces():
-        """Return figure surfaces."""
-        return (
-            (9, 8, 11, 10, 12, 15, 8, 11, 13, 12, 15, 14),
-            (1, 0, 3, 2, 4, 7, 0, 3, 5, 4, 7, 6),
-            (0, 1, 9, 8),
-            (1, 2, 10, 9),
-            (2, 3, 11, 10),
-            (3, 4, 12, 11),
-            (4, 5, 13, 12),
-            (5, 6, 14, 13),
-            (6, 7, 15, 14),
-            (7, 15, 8, 0)
-        )
+    __slots__ = ()
+
+    VERTICES = (
+        (-0.25, 0, -0.5),
+        (0.25, 0, -0.5),
+        (0.5, 0, -0.25),
+        (0.5, 0, 0.25),
+        (0.25, 0, 0.5),
+        (-0.25, 0, 0.5),
+        (-0.5, 0, 0.25),
+        (-0.5, 0, -0.25),
+        (-0.25, 1, -0.5),
+        (0.25, 1, -0.5),
+        (0.5, 1, -0.25),
+        (0.5, 1, 0.25),
+        (0.25, 1, 0.5),
+        (-0.25, 1, 0.5),
+        (-0.5, 1, 0.25),
+        (-0.5, 1, -0.25)
+    )
+
+    EDGES = (
+        (0, 7),
+        (0, 1),
+        (1, 2),
+        (2, 3),
+        (3, 4),
+        (4, 5),
+        (5, 6),
+        (6, 7),
+        (8, 15),
+        (8, 9),
+        (9, 10),
+        (10, 11),
+        (11, 12),
+        (12, 13),
+        (13, 14),
+        (14, 15),
+        (0, 8),
+        (1, 9),
+        (2, 10),
+        (3, 11),
+        (4, 12),
+        (5, 13),
+        (6, 14),
+        (7, 15)
+    )
+
+    SURFACES = (
+        (9, 8, 11, 10, 12, 15, 8, 11, 13, 12, 15, 14),
+        (1, 0, 3, 2, 4, 7, 0, 3, 5, 4, 7, 6),
+        (0, 1, 9, 8),
+        (1, 2, 10, 9),
+        (2, 3, 11, 10),
+        (3, 4, 12, 11),
+        (4, 5, 13, 12),
+        (5, 6, 14, 13),
+        (6, 7, 15, 14),
+        (7, 15, 8, 0)
+    )
 
 
 class Octahedron(Figure3D):
     """A class representing octahedron. It extends Figure3D."""
 
-    @staticmethod
-    def get_vertices():
-        """Return figure vertices."""
-        return (
-            (0, 1, 0),
-            (-0.5, 0, -0.5),
-            (0.5, 0, -0.5),
-            (0.5, 0, 0.5),
-            (-0.5, 0, 0.5),
-            (0, -1, 0)
-        )
-
-    @staticmethod
-    def get_edges():
-        """Return figure edges."""
-        return (
-            (0, 1),
-            (0, 2),
-            (0, 3),
-            (0, 4),
-            (1, 2),
-            (2, 3),
-            (3, 4),
-            (4, 1),
-            (5, 1),
-            (5, 2),
-            (5, 3),
-            (5, 4)
-        )
-
-    @staticmethod
-    def get_surfaces():
-        """Return figure surfaces."""
-        return (
-            (0, 1, 2),
-            (0, 3, 2),
-            (0, 4, 3),
-            (0, 4, 1),
-            (5, 1, 2),
-            (5, 3, 2),
-            (5, 4, 3),
-            (5, 4, 1)
-        )
+    __slots__ = ()
+
+    VERTICES = (
+        (0, 1, 0),
+        (-0.5, 0, -0.5),
+        (0.5, 0, -0.5),
+        (0.5, 0, 0.5),
+        (-0.5, 0, 0.5),
+        (0, -1, 0)
+    )
+
+    EDGES = (
+        (0, 1),
+        (0, 2),
+        (0, 3),
+        (0, 4),
+        (1, 2),
+        (2, 3),
+        (3, 4),
+        (4, 1),
+        (5, 1),
+        (5, 2),
+        (5, 3),
+        (5, 4)
+    )
+
+    SURFACES = (
+        (0, 1, 2),
+        (0, 3, 2),
+        (0, 4, 3),
+        (0, 4, 1),
+        (5, 1, 2),
+        (5, 3, 2),
+        (5, 4, 3),
+        (5, 4, 1)
+    )
 
 
 class Pyramid(Figure3D):
     """A class representing pyramid. It extends Figure3D."""
 
-    @staticmethod
-    def get_vertices():
-        """Return figure vertices."""
-        return (
-            (0, 1, 0),
-            (-1, -1, -1),
-            (1, -1, -1),
-            (1, -1, 1),
-            (-1, -1, 1)
-        )
-
-    @staticmethod
-    def get_edges():
-        """Return figure edges."""
-        return (
-            (0, 1),
-            (0, 2),
-            (0, 3),
-            (0, 4),
-            (1, 2),
-            (2, 3),
-            (3, 4),
-            (4, 1)
-        )
-
-    @staticmethod
-    def get_surfaces():
-        """Return figure surfaces."""
-        return (
-            (0, 1, 2),
-            (0, 3, 2),
-            (0, 4, 3),
-            (0, 4, 1),
-            (1, 2, 3, 4)
-        )
+    __slots__ = ()
+
+    VERTICES = (
+        (0, 1, 0),
+        (-1, -1, -1),
+        (1, -1, -1),
+        (1, -1, 1),
+        (-1, -1, 1)
+    )
+
+    EDGES = (
+        (0, 1),
+        (0, 2),
+        (0, 3),
+        (0, 4),
+        (1, 2),
+        (2, 3),
+        (3, 4),
+        (4, 1)
+    )
+
+    SURFACES = (
+        (0, 1, 2),
+        (0, 3, 2),
+        (0, 4, 3),
+        (0, 4, 1),
+        (1, 2, 3, 4)
+    )
+
+
+FIGURES = {
+    'Cube': Cube,
+    'Octagon': Octagon,
+    'Octahedron': Octahedron,
+    'Pyramid': Pyramid
+}
@@ -4,7 +4,7 @@ This module contains classes responsible for launching game in preferred mode
 - static (2D) or dynamic (3D). It set appropriate environment for game based
 on `pygame` or `OpenGL`. It cover methods which pick proper elements, count
 them, adjust speed and time of a game. Modules used: `OpenGL`, `pathlib`,
-`PIL`, `pygame`, `random`, `sys`, `time`.
+`PIL`, `pygame`, `random`, `time`.
 
 License:
 THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
@@ -16,9 +16,10 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from collections import Counter
+from itertools import cycle
 from pathlib import Path
 from random import sample, choice
-from sys import platform
 from time import time
 
 import OpenGL.GL as gl
@@ -32,6 +33,14 @@ from memorizeit import gui
 from memorizeit import colors
 from memorizeit import config
 
+DIRECTORY = Path(__file__).parent.absolute()
+
+SOUND_FILE = DIRECTORY / 'sound.ogg'
+
+ELEMENTS_DIRECTORY = DIRECTORY / 'img' / 'elements'
+
+IMAGES = {}
+
 
 class Game:
     """
@@ -52,17 +61,32 @@ class Game:
         dictionary with loaded from file settings which will be used in a game
     timer : dict
         dictionary with information about beginning of a game, its length,
-        single and last wave time
+        single and last wave time (also as moments when game ends and last
+        wave can be spawned)
+    now : float
+        time read once per frame by has_time_left() and used by all checks
+        in this frame
     colors : colors.Random
         object responsible for generating random color codes in RGB (0-1, 0-1,
         0-1) format
     elements : dict
         dictionary filled with names of elements used in game and corresponding
          them color
-    counter : dictionary
-        dictionary containing names of elements and their occurrence in game
+    names : tuple
+        names of elements used in game - keys of elements picked from by
+        pick_element()
+    counter : collections.Counter
+        counter containing names of elements and their occurrence in game
     wave : figure.Wave2D or figure.Wave3D
         object responsible for creating wave of elements on the screen
+    sound : pygame.mixer.Sound or None
+        sound played with every new wave, None if setting is turned off or
+        sound couldn't be loaded
+    channels : itertools.cycle or None
+        iterator going round mixer channels reserved for wave sound, None if
+        there is no sound
+    clock : pygame.time.Clock
+        clock limiting game loop to `config.Handler.FPS` frames per second
     """
 
     def __init__(self, resolution):
@@ -78,42 +102,88 @@ class Game:
         pygame.mouse.set_visible(False)
         self.settings = config.Config().get_settings()
         self.timer = self.create_timer()
+        self.now = self.timer['start']
         self.color = colors.Random()
         self.elements = self.set_elements()
-        self.counter = {x: 0 for x in list(self.elements)}
+        self.names = tuple(self.elements)
+        self.counter = Counter(dict.fromkeys(self.names, 0))
         self.wave = None
+        self.sound = self.load_sound()
+        self.channels = self.reserve_channels()
+        self.clock = pygame.time.Clock()
         self.prepare_environment()
         config.Handler(self.run_game, self.has_time_left)()
         pygame.mouse.set_visible(True)
         gui.Summary(self.counter)
 
     def has_time_left(self):
-        """Check if game is still running."""
-        return self.timer['total'] > time() - self.timer['start']
+        """Check if game is still running.
+
+        It is called by `Handler` before each frame, so current time is read
+        here once and stored in now attribute for the rest of the frame.
+        """
+        self.now = time()
+        return self.now < self.timer['end']
 
     def create_timer(self):
         """Create dictionary with information about game time.
 
         It contains beginning of a game, length, single and last wave time.
+        Moments when game ends and after which no new wave is spawned are
+        precomputed, so checks are plain comparisons.
         """
+        start = time()
         total = self.settings['time']
         wave = 7 / self.settings['speed']
         return {
-            'start': time(),
+            'start': start,
             'total': total,
             'wave': wave * 2,
-            'last': total - wave
+            'last': total - wave,
+            'end': start + total,
+            'final': start + total - wave
         }
 
-    def play_sound(self):
-        """Play sound if setting is turned on."""
+    def load_sound(self):
+        """Initialize mixer and load sound once if setting is turned on.
+
+        Returns
+        -------
+        pygame.mixer.Sound or None
+            loaded sound or None if it is turned off or couldn't be loaded
+        """
         if self.settings['sound'] == 'On':
             try:
-                path = Path(__file__).parent.absolute() / 'sound.ogg'
                 pygame.mixer.init()
-                pygame.mixer.Sound(str(path)).play()
+                return pygame.mixer.Sound(str(SOUND_FILE))
             except (pygame.error, FileNotFoundError):
                 pass
+        return None
+
+    def reserve_channels(self):
+        """Reserve all mixer channels for wave sound if it was loaded.
+
+        Each wave plays sound on next reserved channel, so mixer doesn't have
+        to look for free one each time new wave is spawned and sound of
+        previous waves isn't cut off (unless all channels are still busy -
+        the oldest one is reused then).
+
+        Returns
+        -------
+        itertools.cycle or None
+            iterator going round reserved channels or None if there is no
+            sound to play
+        """
+        if self.sound is None:
+            return None
+        amount = pygame.mixer.get_num_channels()
+        pygame.mixer.set_reserved(amount)
+        return cycle([pygame.mixer.Channel(x) for x in range(amount)])
+
+    def play_sound(self):
+        """Play sound on next reserved channel if setting is turned on."""
+        if self.channels is not None:
+            next(self.channels).play(self.sound)
 
     def adjust_elements(self, figures, amount):
         """Set elements used in game.
@@ -143,7 +213,7 @@ class Game:
 
         Based on game difficulty color can be random for each wave or figure.
         """
-        figure = choice(list(self.elements))
+        figure = choice(self.names)
         color = self.elements[figure]
         if not isinstance(color, (pygame.Surface, tuple)):
             color = self.color.get_color() if color else False
@@ -174,16 +244,13 @@ class Game:
         """
         figure = self.pick_element()
         wave = function(*figure, *args)
-        self.counter[figure[0]] = self.counter[figure[0]] + len(wave)
+        self.counter[figure[0]] += len(wave)
         self.play_sound()
         return wave
 
     def is_wave_finished(self, condition):
         """Specify if displayed wave should be replaced with new one."""
-        if condition:
-            if self.timer['last'] > time() - self.timer['start']:
-                return True
-        return False
+        return condition and self.now < self.timer['final']
 
 
 class Static(Game):
@@ -201,36 +268,51 @@ class Static(Game):
     screen: pygame.Surface
         object representing game screen where created 2D figures or images
         will be binded
+    drawn : bool
+        specifies if current wave is already drawn on screen
     """
 
     def prepare_environment(self):
         """Set basics needed to launch 2D game mode.
 
-        Specify attribute used only in static game mode - screen. Extend
-        attribute timer by interval allowing to control spawning new 2D waves
-        on screen.
+        Specify attribute used only in static game mode - screen. Images are
+        converted to screen pixel format, so they are blitted without
+        conversion. Extend attribute timer by moment of next wave allowing to
+        control spawning new 2D waves on screen.
         """
         self.screen = pygame.display.set_mode(
             self.resolution,
             pygame.FULLSCREEN
         )
-        self.timer['interval'] = self.timer['start']
+        for element, image in self.elements.items():
+            if isinstance(image, pygame.Surface):
+                self.elements[element] = image.convert_alpha()
+        self.timer['next'] = self.timer['start'] + self.timer['wave']
         self.wave = self.create_wave(Wave2D, self.screen, self.resolution)
+        self.drawn = False
 
     def run_game(self):
-        """Spawn waves of 2D figures based on time interval."""
-        if self.is_wave_finished(
-                time() > self.timer['interval'] + self.timer['wave']
-        ):
-            self.timer['interval'] += self.timer['wave']
+        """Spawn waves of 2D figures based on time interval.
+
+        Wave is drawn only once, afterwards False is returned to skip
+        refreshing unchanged screen. Loop is limited to Handler.FPS frames per
+        second.
+        """
+        self.clock.tick(config.Handler.FPS)
+        if self.is_wave_finished(self.now > self.timer['next']):
+            self.timer['next'] += self.timer['wave']
             self.spawn_new_wave()
+        elif self.drawn:
+            return False
         else:
             self.wave()
+            self.drawn = True
 
     def spawn_new_wave(self):
         """Clear screen and spawn new wave of figures or images."""
         self.screen.fill((0, 0, 0))
         self.wave = self.create_wave(Wave2D, self.screen, self.resolution)
+        self.drawn = False
 
     def get_images(self):
         """Load images from their directory ('memorizeit/img/elements/').
@@ -243,8 +325,7 @@ class Static(Game):
         """
         images = {}
         try:
-            path = Path(__file__).parent.absolute() / 'img' / 'elements'
-            for image in path.iterdir():
+            for image in ELEMENTS_DIRECTORY.iterdir():
                 images[image.stem] = self.load_image(image)
         except OSError:
             pass
@@ -253,6 +334,12 @@ class Static(Game):
     def load_image(self, path):
         """Load image from set path and scale it.
 
+        Loaded images are cached in module level IMAGES dictionary (by path,
+        its modification time and resolution), so next game doesn't read,
+        decode and scale them again. Cached surface is not modified - copy
+        converted to display format is used in game. Surface is created on
+        top of bytes taken from PIL image without copying them again.
+
         Parameters
         ----------
         path : pathlib.Path
@@ -264,15 +351,22 @@ class Static(Game):
             information about loaded and scaled image represented as
             `pygame.Surface`
         """
-        image = Image.open(path)
-        image = self.fit_image(image)
-        return pygame.image.fromstring(image.tobytes(), image.size, image.mode)
+        key = (path, path.stat().st_mtime_ns, self.resolution)
+        if key not in IMAGES:
+            image = self.fit_image(Image.open(path))
+            IMAGES[key] = pygame.image.frombuffer(image.tobytes(), image.size,
+                                                  image.mode)
+        return IMAGES[key]
 
     def fit_image(self, image):
         """Scale image.
 
-        Lower width or height of image as long as it will fit dedicated place
-        on screen (calculated from monitor resolution).
+        Lower width and height of image with one resize (keeping its ratio),
+        so it will fit dedicated place on screen (calculated from monitor
+        resolution). Image which already fits is returned unchanged. Image
+        has to be opened, but not loaded yet - JPEG decoder is asked then to
+        decode it already reduced (by power of 2, never below target size),
+        so resize has less pixels to process.
 
         Parameters
         ----------
@@ -286,12 +380,12 @@ class Static(Game):
         """
         x, y = [x / 5 for x in self.resolution]
         w, h = image.size
-        ratio = x / w if x < w else y / h if y < h else False
-        if ratio:
-            size = [int(x * ratio) for x in image.size]
-            image = image.resize(size, Image.ANTIALIAS)
-            return self.fit_image(image)
-        return image
+        if w <= x and h <= y:
+            return image
+        ratio = min(x / w, y / h)
+        size = (int(w * ratio), int(h * ratio))
+        image.draft(image.mode, size)
+        return image.resize(size, Image.LANCZOS)
 
     def set_elements(self):
         """Return elements used in game.
@@ -330,6 +424,14 @@ class Dynamic(Game):
     spawned_at : int
         camera Z value (how far from beginning it moved) - needed to create
         figures and make them visible
+    next_spawn : int
+        camera Z value which has to be passed to spawn next wave
+    clipping : tuple
+        near and far clipping plane distance used in perspective
+    speed : float
+        distance camera moves with each frame
+    moved : float
+        total distance camera moved since beginning of a game
     """
 
     def prepare_environment(self):
@@ -338,16 +440,28 @@ class Dynamic(Game):
             self.resolution,
             DOUBLEBUF | OPENGL | pygame.FULLSCREEN
         )
-        gluPerspective(45, (self.resolution[0] / self.resolution[1]), 0.1, 50)
+        self.clipping = (0.1, 50)
+        gluPerspective(45, (self.resolution[0] / self.resolution[1]),
+                       *self.clipping)
+        self.speed = self.get_speed()
+        self.moved = 0
         self.spawned_at = -10
+        self.next_spawn = self.spawned_at - 100
         self.wave = self.create_wave(Wave3D, self.spawned_at)
 
     def run_game(self):
-        """Spawn waves of 3D figures based on length of camera Z movement."""
+        """Spawn waves of 3D figures based on length of camera Z movement.
+
+        Loop is limited to Handler.FPS frames per second, so camera moves
+        with the same speed regardless of used machine. Wave which camera
+        already passed (camera starts at 0 and moves towards negative Z)
+        isn't drawn.
+        """
+        self.clock.tick(config.Handler.FPS)
         camera_z = self.move_view()
-        if self.is_wave_finished(camera_z < self.spawned_at - 100):
+        if self.is_wave_finished(camera_z < self.next_spawn):
             self.spawn_new_wave(camera_z)
-        else:
+        elif not self.wave.is_behind(-self.moved):
             self.wave()
 
     def spawn_new_wave(self, z_position):
@@ -358,21 +472,28 @@ class Dynamic(Game):
         z_position : int
             value of camera Z - where it is moved
         """
-        del self.wave
+        self.wave.release()
         self.wave = self.create_wave(Wave3D, z_position)
         self.spawned_at = z_position
+        self.next_spawn = z_position - 100
 
     def move_view(self):
-        """Responsible for camera movement, return z position."""
+        """Responsible for camera movement, return z position.
+
+        Position is calculated from distance moved by camera instead of
+        reading it back from `OpenGL` matrix (which would wait for all
+        pending commands). Perspective is applied to the same matrix, so its
+        Z row (based on clipping planes) is used in calculation.
+        """
         gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
-        gl.glTranslatef(0, 0, self.get_speed())
-        camera_z = gl.glGetDoublev(gl.GL_MODELVIEW_MATRIX)[3][2]
-        return int(camera_z)
+        gl.glTranslatef(0, 0, self.speed)
+        self.moved += self.speed
+        near, far = self.clipping
+        return int(((far + near) * self.moved + 2 * far * near) / (near - far))
 
     def get_speed(self):
-        """According to used platform adjust speed for moving camera."""
-        s = self.settings['speed']
-        return s / 5 - 0.15 * s if 'win' in platform else s / 5
+        """Return distance camera moves with each frame based on setting."""
+        return self.settings['speed'] / 5
 
     def set_elements(self):
         """From allowed figures return those which are picked to game."""
@@ -5,7 +5,7 @@ menus. It contains methods responsible for making button or displaying label,
 animating them. Here is defined size (width, height) of application. It chains
 elements showed to user with proper functions from other modules. On general
 class Gui are based: main, settings and summary menus. Modules used:
-`collections`, `pathlib`, `pygame`, `sys`.
+`collections`, `functools`, `pathlib`, `pygame`, `sys`.
 
 License:
 THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
@@ -18,15 +18,19 @@ SOFTWARE.
 """
 
 from collections import namedtuple
+from functools import lru_cache
 from pathlib import Path
 import sys
 
 import pygame
+from pygame.locals import FULLSCREEN, OPENGL
 
 from memorizeit import colors
 from memorizeit.config import Config, Handler
 from memorizeit.game import Dynamic, Static
 
+LOGO_FILE = Path(__file__).parent.absolute() / 'img' / 'logo.png'
+
 
 class Gui:
     """
@@ -48,23 +52,87 @@ class Gui:
         0 is inactive color for interactive elements away of mouse cursor. On
         place 1 is active color for interactive elements under mouse cursor.
     Dimensions : namedtuple
-        allows to created namedtuple with size of element - x values from and
-        to, y values from and to.
+        class attribute - allows to created namedtuple with size of element -
+        x values from and to, y values from and to. It is created once for
+        all menus.
     text_size : int
         specifies size of text used in buttons and labels
+    labels : list
+        a list with rendered labels, arrows and their positions waiting to be
+        blitted on screen with one call of blit_labels()
+    mouse : tuple
+        position of mouse cursor read once per frame by read_mouse()
+    pressed : bool
+        True if left mouse button was pressed when read_mouse() was called
+    logo : pygame.Surface or None
+        logo image loaded and scaled once, None if it couldn't be loaded
+    background : pygame.Surface or None
+        copy of drawn background blitted in each frame, None until it is
+        drawn for the first time
+    rects : list
+        a list with `pygame.Rect` areas of screen drawn in current frame
+    drawn : list or None
+        a list with areas drawn in previous frame, None if whole screen has
+        to be refreshed
+    ready : int
+        class attribute shared by all menus - time (`pygame` ticks) from
+        which next click will be accepted
     """
 
+    ready = 0
+    Dimensions = namedtuple('Dimensions', ('x_from', 'x_to', 'y_from', 'y_to'))
+
     def __init__(self):
         """Set basic information used in each menu."""
         self.display = (800, 600)
-        self.screen = pygame.display.set_mode(self.display)
+        self.screen = self.get_screen(self.display)
         self.colors = colors.get_menu_colors()
-        self.Dimensions = namedtuple('Dimensions',
-                                     ('x_from', 'x_to', 'y_from', 'y_to'))
         self.text_size = 25
-        self.blit_background()
+        self.labels = []
+        self.rects = []
+        self.drawn = None
+        self.read_mouse()
+        self.logo = self.load_logo()
+        self.background = None
+
+    @staticmethod
+    def get_screen(display):
+        """Return display surface of set size.
+
+        Display mode is set only when there is no display yet or when it was
+        changed by game (other size, fullscreen or `OpenGL` display). Moving
+        between menus reuses existing surface.
+
+        Parameters
+        ----------
+        display : tuple
+            a tuple with two int values - width, height - size of application
+
+        Returns
+        -------
+        pygame.Surface
+            display surface
+        """
+        screen = pygame.display.get_surface()
+        if (screen is None or screen.get_size() != display
+                or screen.get_flags() & (FULLSCREEN | OPENGL)):
+            screen = pygame.display.set_mode(display)
+        return screen
 
     def blit_background(self):
+        """Blit background of menu on the screen.
+
+        Background doesn't change, so it is drawn only once by
+        draw_background() and copied. Later calls blit this copy on the
+        screen instead.
+        """
+        if self.background is None:
+            self.draw_background()
+            self.background = self.screen.copy()
+        else:
+            self.screen.blit(self.background, (0, 0))
+
+    def draw_background(self):
         """Set menu color to default, display logo and application name."""
         self.screen.fill(colors.get_background_color())
 
@@ -78,17 +146,25 @@ class Gui:
             colors.get_logo_color(),
             size
         )
+        self.blit_labels()
+        if self.logo is not None:
+            size = self.logo.get_size()
+            self.screen.blit(self.logo, (0, self.display[1] - size[1]))
+
+    def load_logo(self):
+        """Return logo image scaled to display or None in case of error."""
         try:
-            image = self.adjust_image()
-            size = image.get_size()
-            self.screen.blit(image, (0, self.display[1] - size[1]))
+            return self.adjust_image()
         except pygame.error:
-            pass
+            return None
 
     def adjust_image(self):
-        """Convert logo image to appropriate size."""
-        path = Path(__file__).parent.absolute() / 'img' / 'logo.png'
-        image = pygame.image.load(str(path))
+        """Convert logo image to appropriate size and display pixel format.
+
+        Display has to be set before, because image is converted to its
+        format, so blitting it doesn't need conversion each frame.
+        """
+        image = pygame.image.load(str(LOGO_FILE)).convert_alpha()
         size = image.get_size()[0]
         display = min(self.display)
 
@@ -97,15 +173,16 @@ class Gui:
             image = pygame.transform.scale(image, size)
         return image
 
-    def animate_element(self, point, dimensions, function,
-                        arguments=None, button=False, message=''):
-        """Highlight element when mouse is over (use active color [1]).
+    def animate_element(self, dimensions, function,
+                        arguments=None, active=True):
+        """Return color of element and use function when it is clicked.
+
+        Dimensions of element are known before it is drawn, so it is drawn
+        only once - with active color [1] when mouse is over, otherwise with
+        inactive color [0].
 
         Parameters
         ----------
-        point : tuple
-            a tuple with two int values - width, height allowing to draw
-            animated element
         dimensions : namedtuple
             namedtuple with size of area - x values from and to, y values from
             and to. Moving cursor over this area will animate element and
@@ -115,30 +192,30 @@ class Gui:
         arguments : list, None, optional
             a list with arguments passed to function if they are needed
             (default is None - function without arguments)
-        button : str, bool, optional
-            specifies what type of button will be animated (True - with
-            border, False - only label, left or right - arrow with set
-            direction (default is False - label)
-        message : str, optional
-            text used in animated button (default is '' which means empty - no
-            text at all, used with arrow buttons)
+        active : bool, optional
+            False if element shouldn't be animated at all (default is True)
+
+        Returns
+        -------
+        tuple
+            RGB color code in format (0-255, 0-255, 0-255) which should be
+            used to draw element
         """
-        if self.is_mouse_over(dimensions):
-            if button:
-                if button == 'left':
-                    self.draw_triangle(self.colors[1], point)
-                elif button == 'right':
-                    self.draw_triangle(self.colors[1], point, left=False)
-                else:
-                    self.draw_button(message, self.colors[1], point)
-            else:
-                self.create_label(message, point, self.colors[1])
+        if active and self.is_mouse_over(dimensions):
             self.use_on_click(function, arguments)
+            return self.colors[1]
+        return self.colors[0]
 
-    @staticmethod
-    def is_mouse_over(dimensions):
+    def read_mouse(self):
+        """Store mouse position and left button state for current frame."""
+        self.mouse = pygame.mouse.get_pos()
+        self.pressed = pygame.mouse.get_pressed()[0]
+
+    def is_mouse_over(self, dimensions):
         """Specify if mouse is over area.
 
+        Mouse position stored by read_mouse() is used.
+
         Parameters
         ----------
         dimensions : namedtuple
@@ -150,16 +227,18 @@ class Gui:
         bool
             True when mouse cursor is over set area else False
         """
-        mouse = pygame.mouse.get_pos()
-        if dimensions.x_from < mouse[0] < dimensions.x_to:
-            if dimensions.y_from < mouse[1] < dimensions.y_to:
-                return True
-        return False
+        x, y = self.mouse
+        x_from, x_to, y_from, y_to = dimensions
+        return x_from < x < x_to and y_from < y < y_to
 
-    @staticmethod
-    def use_on_click(function, arguments):
+    def use_on_click(self, function, arguments):
         """Use function when mouse button is pressed.
 
+        Button state stored by read_mouse() is used. It is read again after
+        function is used, because it may run other menu or game in meantime
+        (whole screen is refreshed in next frame then). Next click is accepted
+        after 100 ms, but loop is not blocked in meantime.
+
         Parameters
         ----------
         function : function
@@ -168,9 +247,11 @@ class Gui:
             a list with arguments passed to function or None if function
             doesn't require arguments
         """
-        if pygame.mouse.get_pressed()[0]:
+        if self.pressed and pygame.time.get_ticks() >= Gui.ready:
             function(*arguments) if arguments else function()
-            pygame.time.delay(100)
+            Gui.ready = pygame.time.get_ticks() + 100
+            self.read_mouse()
+            self.drawn = None
 
     def create_arrows(self, point, position, gap,
                       value, left_condition, right_condition, function):
@@ -198,19 +279,19 @@ class Gui:
         function : function
             function used during mouse click on animated element
         """
-        new_point = [point[0] - gap // 2, point[1]]
-        left = self.draw_triangle(self.colors[0], new_point)
-        if value > left_condition:
-            self.animate_element(
-                new_point, left, function, [position, False], 'left'
-            )
+        new_point = (point[0] - gap // 2, point[1])
+        color = self.animate_element(
+            self.get_triangle_dimensions(new_point), function,
+            [position, False], value > left_condition
+        )
+        self.draw_triangle(color, new_point)
 
-        new_point[0] += gap
-        right = self.draw_triangle(self.colors[0], new_point, False)
-        if value < right_condition:
-            self.animate_element(
-                new_point, right, function, [position], 'right'
-            )
+        new_point = (new_point[0] + gap, point[1])
+        color = self.animate_element(
+            self.get_triangle_dimensions(new_point, False), function,
+            [position], value < right_condition
+        )
+        self.draw_triangle(color, new_point, False)
 
     def draw_triangle(self, color, point, left=True):
         """Draw triangle on the screen.
@@ -232,21 +313,62 @@ class Gui:
             namedtuple with size of triangle - x values from and to, y values
             from and to
         """
-        dimensions = self.Dimensions(
-            point[0] - 10, point[0], point[1] - 10, point[1] + 10
-        )
-        coordinates = [(dimensions.x_to, point[1])]
-        x = 'x_from'
-        if left:
-            dimensions = self.Dimensions(
-                point[0], point[0] + 10, point[1] - 10, point[1] + 10
-            )
-            x = 'x_to'
-        coordinates.extend([(getattr(dimensions, x), dimensions.y_from),
-                            (getattr(dimensions, x), dimensions.y_to)])
-        pygame.draw.polygon(self.screen, color, coordinates)
+        dimensions = self.get_triangle_dimensions(point, left)
+        self.labels.append((self.get_arrow(color, left),
+                            (dimensions.x_from, dimensions.y_from)))
         return dimensions
 
+    def get_triangle_dimensions(self, point, left=True):
+        """Return size of triangle without drawing it.
+
+        Parameters
+        ----------
+        point : tuple
+            a tuple with two int values - width, height specifies where
+            triangle will be drawn
+        left : bool, optional
+            parameter specifying which side triangle will be pointed (default
+            is True - left side)
+
+        Returns
+        -------
+        Dimensions
+            namedtuple with size of triangle - x values from and to, y values
+            from and to
+        """
+        x, y = point
+        if left:
+            return self.Dimensions(x, x + 10, y - 10, y + 10)
+        return self.Dimensions(x - 10, x, y - 10, y + 10)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_arrow(color, left):
+        """Return surface with triangle (arrow) drawn in set color.
+
+        Arrows are the same in each frame, so they are drawn once for each
+        color and direction and then blitted together with labels.
+
+        Parameters
+        ----------
+        color : tuple
+            RGB color code in format (0-255, 0-255, 0-255) (must be hashable)
+        left : bool
+            True if triangle is pointed to the left side
+
+        Returns
+        -------
+        pygame.Surface
+            transparent surface (11 wide, 21 high) with triangle drawn on it
+        """
+        arrow = pygame.Surface((11, 21), pygame.SRCALPHA)
+        if left:
+            coordinates = ((0, 10), (10, 0), (10, 20))
+        else:
+            coordinates = ((10, 10), (0, 0), (0, 20))
+        pygame.draw.polygon(arrow, color, coordinates)
+        return arrow
+
     def create_button(self, message,
                       point, function, arguments=None, border=False):
         """Draw and animates button.
@@ -271,12 +393,15 @@ class Gui:
             label (default False - label)
         """
         if border:
-            button = self.draw_button(message, self.colors[0], point)
+            dimensions = self.get_border(point, self.text_size)[1]
         else:
-            button = self.create_label(message, point)
-        self.animate_element(
-            point, button, function, arguments, border, message
-        )
+            text = self.get_text(message, self.text_size, self.colors[0])
+            dimensions = self.get_label_dimensions(text, point)
+        color = self.animate_element(dimensions, function, arguments)
+        if border:
+            self.draw_button(message, color, point)
+        else:
+            self.create_label(message, point, color)
 
     def draw_button(self, message, color, point):
         """Draw button on the screen.
@@ -306,6 +431,9 @@ class Gui:
     def create_label(self, message, mid_point, color=None, size=None):
         """Display text on the screen.
 
+        Rendered text is added to labels list and blitted together with other
+        labels by blit_labels().
+
         Parameters
         ----------
         message : str
@@ -327,19 +455,104 @@ class Gui:
         if size is None:
             size = self.text_size
 
-        text = pygame.font.SysFont('carlito', size, True).render(message,
-                                                                 True, color)
-        x_shift = text.get_width() // 2
-        y_shift = text.get_height() // 2
+        text = self.get_text(message, size, color)
+        dimensions = self.get_label_dimensions(text, mid_point)
+        self.labels.append((text, (dimensions.x_from, dimensions.y_from)))
+        return dimensions
 
-        self.screen.blit(text, (mid_point[0] - x_shift,
-                                mid_point[1] - y_shift))
+    def get_label_dimensions(self, text, mid_point):
+        """Return size of label centered in set point without displaying it.
 
+        Parameters
+        ----------
+        text : pygame.Surface
+            surface with rendered text
+        mid_point : tuple
+            a tuple with two int values - width, height specifies middle point
+            of text
+
+        Returns
+        -------
+        Dimensions
+            namedtuple with size of label - x values from and to, y values
+            from and to
+        """
+        x_shift = text.get_width() // 2
+        y_shift = text.get_height() // 2
         return self.Dimensions(mid_point[0] - x_shift,
                                mid_point[0] + x_shift,
                                mid_point[1] - y_shift,
                                mid_point[1] + y_shift)
 
+    def blit_labels(self):
+        """Blit all waiting labels and arrows on the screen with one call."""
+        self.rects.extend(self.screen.blits(self.labels))
+        self.labels.clear()
+
+    def update_screen(self):
+        """Blit waiting labels and refresh only changed areas of screen.
+
+        Areas drawn in previous frame are refreshed too, so elements which
+        changed size or disappeared are cleared. Whole screen is refreshed
+        when drawn attribute is None.
+
+        Returns
+        -------
+        False
+            screen is already refreshed, so `Handler` doesn't have to do it
+        """
+        self.blit_labels()
+        if self.drawn is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(self.drawn + self.rects)
+        self.drawn, self.rects = self.rects, []
+        return False
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_font(size):
+        """Return bold system font of passed size.
+
+        Font is loaded only once for each size and then reused by every
+        label, so font file isn't opened and parsed again each frame.
+
+        Parameters
+        ----------
+        size : int
+            size of text which will be rendered with font
+
+        Returns
+        -------
+        pygame.font.Font
+            loaded 'carlito' bold system font
+        """
+        return pygame.font.SysFont('carlito', size, True)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def get_text(message, size, color):
+        """Return surface with rendered text.
+
+        Labels are mostly the same each frame, so rendered surfaces are
+        cached and only blitted afterwards.
+
+        Parameters
+        ----------
+        message : str
+            text which will be rendered
+        size : int
+            size of rendered text
+        color : tuple
+            RGB color code in format (0-255, 0-255, 0-255) (must be hashable)
+
+        Returns
+        -------
+        pygame.Surface
+            surface with rendered text (should not be modified)
+        """
+        return Gui.get_font(size).render(message, True, color)
+
     def draw_border(self, color, point):
         """Draw border surrounding set point.
 
@@ -357,16 +570,42 @@ class Gui:
             namedtuple with size of border - x values from and to, y values
             from and to
         """
-        width = self.text_size * 10
-        height = self.text_size * 2
-        border = pygame.Rect(point[0], point[1], width, height)
+        border, dimensions = self.get_border(point, self.text_size)
+        self.rects.append(
+            pygame.draw.rect(self.screen, color, border, self.text_size // 10)
+        )
+        return dimensions
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_border(point, text_size):
+        """Return border rectangle and its dimensions for set point.
+
+        Buttons don't move, so rectangle is created once for each position
+        and reused in every frame.
 
-        pygame.draw.rect(self.screen, color, border, self.text_size // 10)
+        Parameters
+        ----------
+        point : tuple
+            a tuple with two int values - width, height specifies where
+            border will be drawn
+        text_size : int
+            size of text used in buttons - border is 10 times wider and 2
+            times higher
 
-        return self.Dimensions(point[0],
-                               point[0] + width,
-                               point[1],
-                               point[1] + height)
+        Returns
+        -------
+        tuple
+            `pygame.Rect` of border (should not be modified) and Dimensions
+            namedtuple with x values from and to, y values from and to
+        """
+        width = text_size * 10
+        height = text_size * 2
+        border = pygame.Rect(point[0], point[1], width, height)
+        return border, Gui.Dimensions(point[0],
+                                      point[0] + width,
+                                      point[1],
+                                      point[1] + height)
 
 
 class Menu(Gui):
@@ -384,7 +623,10 @@ class Menu(Gui):
         resolution
     positions : dict
         a dictionary with names of displayed buttons and corresponding to them
-        classes or functions
+        classes or functions with list of their arguments
+    buttons : list
+        a list with message, point, function and arguments of each button -
+        layout of menu computed once
 
 
     Methods
@@ -398,15 +640,20 @@ class Menu(Gui):
 
     def __init__(self):
         """Initialize main menu."""
-        self.resolution = (pygame.display.Info().current_w,
-                           pygame.display.Info().current_h)
+        info = pygame.display.Info()
+        self.resolution = (info.current_w, info.current_h)
         self.positions = {
-            'New game': Dynamic,
-            'Static game': Static,
-            'Settings': Settings,
-            'Exit': self.close
+            'New game': (Dynamic, [self.resolution]),
+            'Static game': (Static, [self.resolution]),
+            'Settings': (Settings, []),
+            'Exit': (self.close, [])
         }
         super().__init__()
+        x, y = (x - 325 for x in self.display)
+        self.buttons = [
+            (position, (x, y + gap * 70), *button)
+            for gap, (position, button) in enumerate(self.positions.items())
+        ]
         Handler(self)()
 
     def __call__(self):
@@ -416,16 +663,11 @@ class Menu(Gui):
         used in application. This method is send to `pygame` event handler
         class to run in loop.
         """
+        self.read_mouse()
         self.blit_background()
-        point = tuple(x - 325 for x in self.display)
-
-        for gap, position in enumerate(self.positions):
-            gap *= 70
-            new_point = (point[0], point[1] + gap)
-            arguments = [self.resolution] if 'game' in position else []
-
-            self.create_button(position, new_point,
-                               self.positions[position], arguments, True)
+        for button in self.buttons:
+            self.create_button(*button, True)
+        return self.update_screen()
 
     @staticmethod
     def close():
@@ -450,17 +692,32 @@ class Settings(Gui):
         a dictionary with settings loaded from config
     range : dict
         a dictionary with allowed values for each setting
+    saved : dict
+        a copy of settings stored in configuration file
+    names : dict
+        a dictionary with settings and their labels displayed in menu
     run : Handler
         object from config module allowing for handling `pygame` events.
         Chained to run variable for communication.
     """
 
     def __init__(self):
-        """Initialize settings menu."""
+        """Initialize settings menu.
+
+        Settings are saved once menu is left and only if they were changed.
+        They are saved also when application is closed from this menu.
+        """
         super().__init__()
         self.config = Config()
+        self.saved = dict(self.config.settings)
+        self.names = {
+            key: key.capitalize() + ':' for key in self.config.settings
+        }
         self.run = Handler(self)
-        self.run()
+        try:
+            self.run()
+        finally:
+            self.save_settings()
 
     def __call__(self):
         """Draw and animates elements in settings menu.
@@ -470,18 +727,18 @@ class Settings(Gui):
         displays in between them. This method is send to `pygame` event
         handler class to run in loop.
         """
+        self.read_mouse()
         self.blit_background()
         point = (self.display[0] - 150, self.display[1] - 375)
 
         for position in self.config.settings:
             point = (point[0], point[1] + 50)
-            self.create_label(position.capitalize() + ':',
+            self.create_label(self.names[position],
                               (point[0] - 150, point[1]))
             text = str(self.config.settings[position])
             self.create_label(text, point)
 
-            scope = self.config.range[position]
-            index = scope.index(self.config.settings[position])
+            index = self.config.index[position][self.config.settings[position]]
             self.create_arrows(
                 point, position, 150, index, 0,
                 len(self.config.range[position]) - 1,
@@ -489,11 +746,8 @@ class Settings(Gui):
             )
 
         point = (self.display[0] - 75, self.display[1] - 50)
-        self.create_button(
-            'Back', point,
-            lambda: self.run.stop(),
-            self.config.save(self.config.settings)
-        )
+        self.create_button('Back', point, self.run.stop)
+        return self.update_screen()
 
     def change_setting(self, position, add=True):
         """Set displayed setting to lower or higher value.
@@ -510,11 +764,16 @@ class Settings(Gui):
             True if value will be increased, False when decreased (default is
             True)
         """
-        scope = self.config.range[position]
-        index = scope.index(self.config.settings[position])
+        index = self.config.index[position][self.config.settings[position]]
         modify = index + 1 if add else index - 1
         self.config.settings[position] = self.config.range[position][modify]
 
+    def save_settings(self):
+        """Save settings to configuration file if they were changed."""
+        if self.config.settings != self.saved:
+            self.config.save(self.config.settings)
+            self.saved = dict(self.config.settings)
+
 
 class Summary(Gui):
     """
@@ -532,6 +791,8 @@ class Summary(Gui):
        a dictionary with values filled by user
     submitted : bool
        value specifying if user pressed submit button to check his result
+    names : dict
+       a dictionary with elements and their labels displayed in menu
     run : Handler
        object from config module allowing for handling `pygame` events.
        Chained to run variable for communication.
@@ -542,6 +803,9 @@ class Summary(Gui):
     call()
         draws and animates elements on screen - it is send to `pygame` event
         handler class to run in loop
+    draw_background()
+        fills screen with menu color and displays summary title - drawn once
+        and copied by blit_background()
     change_counter(position, add)
         method used to increase or decrease number of element filled by user.
         It is send to create_arrows method
@@ -561,6 +825,7 @@ class Summary(Gui):
         super().__init__()
         self.result = result
         self.counted = {key: 0 for key in result}
+        self.names = {key: key.capitalize() + 's:' for key in result}
         self.submitted = False
         self.run = Handler(self)
         self.run()
@@ -573,14 +838,13 @@ class Summary(Gui):
         numbers - it marks wrong values with red color and good with green.
         This method is send to `pygame` event handler class to run in loop.
         """
-        self.screen.fill(colors.get_background_color())
-        self.create_label('Check your result:',
-                          (self.display[0] // 2, 75), size=50)
+        self.read_mouse()
+        self.blit_background()
         point = (self.display[0] // 2, 100)
 
         for position in self.counted:
             point = (point[0], point[1] + 50)
-            self.create_label(position.capitalize() + 's:',
+            self.create_label(self.names[position],
                               (point[0] - 125, point[1]))
             text = str(self.counted[position])
 
@@ -606,6 +870,14 @@ class Summary(Gui):
             self.create_button('Submit', point, self.submit)
         point[0] += 100
         self.create_button('Back', point, self.run.stop)
+        return self.update_screen()
+
+    def draw_background(self):
+        """Set menu color to default and display summary title."""
+        self.screen.fill(colors.get_background_color())
+        self.create_label('Check your result:',
+                          (self.display[0] // 2, 75), size=50)
+        self.blit_labels()
 
     def change_counter(self, position, add=True):
         """Set displayed occurrence of element to lower or higher value.